@@ -60,13 +60,21 @@ Then run:
 """
 import argparse
 import datetime as _dt
+import functools
+import gzip
+import hashlib
 import json
 import mimetypes
 import os
 from pathlib import Path
+import re
 import shutil
+import sqlite3
+import stat
 import sys
 import csv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Optional: requests, else fallback to urllib
@@ -77,30 +85,101 @@ except Exception:
 import urllib.request
 import urllib.error
 
+# Optional: orjson for the hot JSON paths, else stdlib json
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(o) -> str:
+        return orjson.dumps(o).decode("utf-8")
+    def _dumps_line(o) -> bytes:
+        return orjson.dumps(o, option=orjson.OPT_APPEND_NEWLINE)
+    _loads = orjson.loads
+else:
+    def _dumps(o) -> str:
+        return json.dumps(o, ensure_ascii=False)
+    def _dumps_line(o) -> bytes:
+        return (json.dumps(o, ensure_ascii=False) + "\n").encode("utf-8")
+    _loads = json.loads
+
+# Shared session so concurrent batches reuse keep-alive connections
+_SESSION = requests.Session() if requests is not None else None
+
 # --------------------------- Constants ---------------------------------------
 
 DEFAULT_API_BASE = "http://127.0.0.1:1234/v1"
 DEFAULT_MODEL = "deepseek/deepseek-r1-0528-qwen3-8b"
 DEFAULT_AUTH = "Bearer lm-studio"
+DEFAULT_CACHE_PATH = Path("~/.cache/autofile/cache.sqlite")
+GZIP_MIN_BYTES = 16384  # request bodies above this are sent gzip-encoded
+# Reply budget: a {"results":[...]} entry runs ~30 tokens; leave room for a reasoning preamble
+MIN_REPLY_TOKENS = 1024
+TOKENS_PER_RESULT = 60
+
+CATEGORY_KEYS = frozenset({"admin","proposals","data","code","talks","manuscript","unknown","ignore"})
+
+# Rule-based decision used when the model gives nothing usable, one per category;
+# the planning loop copies these rather than building a fresh dict per record.
+FALLBACK_DECISIONS = {
+    c: {"id": None, "category": c, "confidence": 0.65, "reason": "rule-based fallback", "rename": ""}
+    for c in CATEGORY_KEYS
+}
+# Model answers in UNSURE_CATEGORIES are replaced by a rule guess in UPGRADE_CATEGORIES
+UNSURE_CATEGORIES = frozenset({"unknown","ignore"})
+UPGRADE_CATEGORIES = frozenset({"data","code","manuscript","talks","proposals","admin"})
+UPGRADE_NOTE = " | upgraded by extension rule"
 
-CATEGORY_KEYS = {"admin","proposals","data","code","talks","manuscript","unknown","ignore"}
-
-AUTOFILE_CONFIG_NAMES = {".autofile.json", "autofile.json", "_autofile.json"}
+AUTOFILE_CONFIG_NAMES = frozenset({".autofile.json", "autofile.json", "_autofile.json"})
 
-TEXT_EXT = {
+TEXT_EXT = frozenset({
     ".txt",".md",".rst",".tex",".bib",".csv",".tsv",".json",".yaml",".yml",".ini",".cfg",".toml",
     ".py",".r",".R",".ipynb",".m",".jl",".sh",".bash",".ps1",".bat",".sql",".log"
-}
+})
+
+# Never text, so is_textlike can skip the mimetypes lookup for them
+KNOWN_BINARY_EXT = frozenset({
+    ".pdf",".jpg",".jpeg",".png",".tif",".tiff",".zip",".gz",".bam",".xlsx",".docx",".pptx",".key",
+    ".parquet",".h5",".hdf5"
+})
 
-DATA_EXT = {
+DATA_EXT = frozenset({
     ".csv",".tsv",".xlsx",".xls",".parquet",".h5",".hdf5",".feather",".rds",".rdata",".sav",".dta",".mat",
     ".gz",".zip",".fastq",".fq",".bam",".sam",".vcf",".tif",".tiff",".nii",".nii.gz"
-}
-CODE_EXT = {".py",".r",".R",".ipynb",".m",".jl",".sh",".bash",".bat",".ps1",".sql",".yaml",".yml",".toml",".json"}
-TALKS_EXT = {".ppt",".pptx",".key",".pdf"}
-MANUSCRIPT_EXT = {".tex",".bib",".doc",".docx",".rtf",".odt",".pdf",".svg",".eps",".png",".jpg",".jpeg",".tif",".tiff"}
-
-DEFAULT_IGNORE_DIRS = {"venv",".venv","__pycache__","node_modules","dist","build",".ipynb_checkpoints",".mypy_cache",".pytest_cache",".Rproj.user",".idea",".vscode"}
+})
+CODE_EXT = frozenset({".py",".r",".R",".ipynb",".m",".jl",".sh",".bash",".bat",".ps1",".sql",".yaml",".yml",".toml",".json"})
+TALKS_EXT = frozenset({".ppt",".pptx",".key",".pdf"})
+MANUSCRIPT_EXT = frozenset({".tex",".bib",".doc",".docx",".rtf",".odt",".pdf",".svg",".eps",".png",".jpg",".jpeg",".tif",".tiff"})
+FIGURE_EXT = frozenset({".pdf",".tif",".tiff",".png",".jpg",".jpeg",".svg",".eps"})
+
+# One lookup per file instead of a chain of set tests; earlier entries win, in
+# the same order guess_category_by_rules used to test the sets.
+EXT_TO_CATEGORY = {}
+for _cat, _exts in (("code", CODE_EXT), ("data", DATA_EXT), ("talks", TALKS_EXT), ("manuscript", MANUSCRIPT_EXT)):
+    for _ext in _exts:
+        EXT_TO_CATEGORY.setdefault(_ext, _cat)
+
+# Filename keyword bags for guess_category_by_rules, one compiled alternation per
+# bag so each check is a single C-level scan instead of a Python loop.
+PROPOSAL_KW = ["specific aims", "aims", "proposal", "grant", "biosketch", "narrative", "cover letter"]
+ADMIN_KW = ["irb", "mta", "dua", "du a", "nda", "budget", "invoice", "contract", "ica", "agreement", "ethics"]
+MANUS_KW = ["manuscript", "paper", "ms", "draft", "submission", "rebuttal", "overleaf"]
+TALK_KW = ["slides", "talk", "poster", "deck", "seminar", "colloquium", "keynote"]
+FIGURE_KW = ["figure", "fig ", "fig_", "supplemental figure", "supp fig"]
+SUPP_KW = ["supplemental", "supp", "suppl"]
+TABLE_KW = ["table", "supplemental table", "supp table"]
+
+def _kw_regex(words):
+    return re.compile("|".join(map(re.escape, words)))
+
+PROPOSAL_RE = _kw_regex(PROPOSAL_KW)
+ADMIN_RE = _kw_regex(ADMIN_KW)
+MANUS_RE = _kw_regex(MANUS_KW)
+TALK_RE = _kw_regex(TALK_KW)
+ASSET_RE = _kw_regex(FIGURE_KW + SUPP_KW + TABLE_KW)
+
+DEFAULT_IGNORE_DIRS = frozenset({"venv",".venv","__pycache__","node_modules","dist","build",".ipynb_checkpoints",".mypy_cache",".pytest_cache",".Rproj.user",".idea",".vscode"})
 
 SYSTEM_PROMPT = """You are a meticulous file-intake classifier for an academic research lab.
 Decide which category each file belongs to, based on filename, extension, size, and a small text preview when available.
@@ -114,10 +193,14 @@ Pick exactly one category from:
 - unknown      : unclear; send to quarantine
 - ignore       : junk or generated files we should skip (e.g., .DS_Store, Thumbs.db, cache, tmp).
 
-Output STRICTLY in JSON Lines (JSONL), one object per file we give you, with this schema:
-{"id": "<opaque id we provide>", "category":"admin|proposals|data|code|talks|manuscript|unknown|ignore", "confidence": 0.0-1.0, "reason": "short rationale", "rename": "optional new safe filename or empty string"}
+Input is a JSON object {"files":[...]} with compact keys per file:
+  id = opaque id, n = filename, e = extension, s = size in bytes, p = last parent folders,
+  g = rule-based guess, t = text preview (optional)
 
-Never include code fences, markdown, or extra prose. Only JSONL.
+Output STRICTLY one JSON object with this schema, one entry per file we give you:
+{"results":[{"id": "<opaque id we provide>", "category":"admin|proposals|data|code|talks|manuscript|unknown|ignore", "confidence": 0.0-1.0, "reason": "short rationale", "rename": "optional new safe filename or empty string"}]}
+
+Never include code fences, markdown, or extra prose. Only the JSON object.
 If uncertain, choose 'unknown' with moderate confidence and explain why in 'reason'."""
 
 # --------------------------- Utilities ---------------------------------------
@@ -143,30 +226,36 @@ def ensure_project_skeleton(project_dir: Path):
 
 
 def prune_empty_children(root: Path):
-    # Remove empty dirs beneath root (but not root itself)
-    for d in sorted([p for p in root.rglob("*") if p.is_dir()], reverse=True):
-        try:
-            next(d.iterdir())
-        except StopIteration:
-            try: d.rmdir()
-            except Exception: pass
+    # Remove empty dirs beneath root (but not root itself). Bottom-up, so a dir
+    # whose subdirs were all just removed is empty by the time we reach it;
+    # rmdir itself refuses non-empty dirs, so no separate emptiness check.
+    top = str(root)
+    for d, _, files in os.walk(top, topdown=False):
+        if files or d == top:
+            continue
+        try: os.rmdir(d)
+        except OSError: pass
 
-def safe_relpath(child: Path, parent: Path) -> Path:
-    try:
-        return child.relative_to(parent)
-    except Exception:
-        return Path(child.name)
+def name_suffix(name: str) -> str:
+    # Path(name).suffix without building a Path
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
 
 def have_requests():
     return requests is not None
 
-def post_chat_completion(api_base: str, model: str, messages: list, timeout: int = 60):
+# Endpoints that rejected response_format / gzip bodies this run; later batches go without them
+_NO_JSON_MODE = set()
+_NO_GZIP = set()
+
+def post_chat_completion(api_base: str, model: str, messages: list, timeout: int = 60, json_mode: bool = True, compress: bool = True, max_tokens: int = MIN_REPLY_TOKENS):
     url = api_base.rstrip("/") + "/chat/completions"
+    json_mode = json_mode and url not in _NO_JSON_MODE
     payload = {
         "model": model,
         "messages": messages,
         "temperature": 0.2,
-        "max_tokens": 1024,
+        "max_tokens": max_tokens,
         "stream": False,
     }
     headers = {
@@ -174,242 +263,444 @@ def post_chat_completion(api_base: str, model: str, messages: list, timeout: int
         "Authorization": os.environ.get("LMSTUDIO_AUTH", DEFAULT_AUTH),
     }
 
-    data = json.dumps(payload).encode("utf-8")
-
-    if have_requests():
-        resp = requests.post(url, headers=headers, data=data, timeout=timeout)
-        resp.raise_for_status()
-        return resp.json()
-    else:
-        req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+    def send(with_format, gz):
+        # (None, reply) on success, (status, error) on 400/415; anything else raises
+        body = dict(payload, response_format={"type": "json_object"}) if with_format else payload
+        data = _dumps(body).encode("utf-8")
+        hdrs = headers
+        if gz:
+            data = gzip.compress(data, compresslevel=1)
+            hdrs = dict(headers, **{"Content-Encoding": "gzip"})
+        if have_requests():
+            resp = _SESSION.post(url, headers=hdrs, data=data, timeout=timeout)
+            try:
+                resp.raise_for_status()
+            except requests.HTTPError as e:
+                if resp.status_code in (400, 415):
+                    return resp.status_code, e
+                raise
+            return None, _loads(resp.content)
+        req = urllib.request.Request(url, data=data, headers=hdrs, method="POST")
         try:
             with urllib.request.urlopen(req, timeout=timeout) as f:
-                body = f.read().decode("utf-8")
-                return json.loads(body)
+                return None, _loads(f.read().decode("utf-8"))
         except urllib.error.HTTPError as e:
-            raise RuntimeError(f"HTTPError {e.code}: {e.read().decode('utf-8', errors='ignore')}") from e
-
-def is_textlike(path: Path):
-    if path.suffix.lower() in TEXT_EXT:
+            err = RuntimeError(f"HTTPError {e.code}: {e.read().decode('utf-8', errors='ignore')}")
+            err.__cause__ = e
+            if e.code in (400, 415):
+                return e.code, err
+            raise err
+
+    # Big batches with previews run 80-200 KB; level 1 is close to memcpy speed on JSON text
+    compressed = (compress and url not in _NO_GZIP
+                  and len(_dumps(payload).encode("utf-8")) > GZIP_MIN_BYTES)
+    status, out = send(json_mode, compressed)
+    if status is None:
+        return out
+    # A 400 is more often response_format than gzip, so drop that first and keep the body small;
+    # a 415 is always the encoding. Fall back to dropping both.
+    attempts = []
+    if json_mode and status == 400:
+        attempts.append((False, compressed))
+    if compressed:
+        attempts.append((json_mode, False))
+    if json_mode and compressed and status == 400:
+        attempts.append((False, False))
+    for with_format, gz in attempts:
+        again, reply = send(with_format, gz)
+        if again is None:
+            # only remember what the working request had to leave out
+            if json_mode and not with_format:
+                _NO_JSON_MODE.add(url)
+            if compressed and not gz:
+                _NO_GZIP.add(url)
+            return reply
+    raise out
+
+def is_textlike(path: str):
+    suffix = name_suffix(os.path.basename(path)).lower()
+    if suffix in TEXT_EXT:
         return True
-    mtype, _ = mimetypes.guess_type(str(path))
+    if suffix in KNOWN_BINARY_EXT:
+        return False
+    mtype, _ = mimetypes.guess_type(path)
     return (mtype or "").startswith("text/")
 
-def preview_text(path: Path, max_bytes: int = 2000):
+def preview_text(path: str, max_bytes: int = 2000, size: int | None = None):
+    # Raw fd read: no buffered reader to set up, and small files come back in one read
+    if size == 0:
+        return ""
+    n = max_bytes if size is None else min(size, max_bytes)
     try:
-        with path.open("rb") as f:
-            data = f.read(max_bytes)
+        fd = os.open(str(path), os.O_RDONLY)
+        try:
+            data = os.read(fd, n)
+        finally:
+            os.close(fd)
         return data.decode("utf-8", errors="ignore")
     except Exception:
         return ""
 
+# --------------------------- Decision cache ----------------------------------
+
+def open_decision_cache(path: Path = DEFAULT_CACHE_PATH):
+    path = path.expanduser()
+    ensure_dir(path.parent)
+    db = sqlite3.connect(str(path))
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, decision TEXT)")
+    return db
+
+def decision_cache_key(path: str, rel_path: str, st, model: str, include_content: bool) -> str:
+    # Same relative path (name + parent folders, the model's main inputs), size, mtime and
+    # first 8 KiB, asked with the same model and preview setting => same answer, rename included.
+    # Identical copies under different names (e.g. an extracted archive) get separate entries.
+    try:
+        with open(path, "rb") as f:
+            head = f.read(8192)
+    except Exception:
+        return ""
+    digest = hashlib.blake2b(head, digest_size=8).hexdigest()
+    return f"{model}:{int(include_content)}:{st.st_size}:{st.st_mtime_ns}:{digest}:{rel_path}"
+
 # --------------------------- Bundle detection --------------------------------
 
-def is_code_repo_root(p: Path) -> bool:
-    markers = [".git","pyproject.toml","requirements.txt","setup.py","environment.yml","package.json",
-               "Cargo.toml","Makefile",".Rproj",".Rproj.user","src"]
-    for m in markers:
-        if (p / m).exists():
-            return True
-    return False
+CODE_MARKERS = frozenset({".git","pyproject.toml","requirements.txt","setup.py","environment.yml","package.json",
+                          "Cargo.toml","Makefile",".Rproj",".Rproj.user","src"})
+FIGURE_DIRS = frozenset({"figures","figs","images","img"})
+
+@functools.lru_cache(maxsize=4096)
+def _child_names(p: str) -> frozenset:
+    # One readdir per directory, shared by both detectors
+    try:
+        with os.scandir(p) as it:
+            return frozenset(e.name for e in it)
+    except OSError:
+        return frozenset()
 
-def is_manuscript_root(p: Path) -> bool:
+def is_code_repo_root(p: str) -> bool:
+    return not CODE_MARKERS.isdisjoint(_child_names(p))
+
+def is_manuscript_root(p: str) -> bool:
     # Strong signals
-    if "manuscript" in p.name.lower() or "paper" in p.name.lower():
-        return True
-    if any(p.glob("*.tex")) and (list(p.glob("*.bib")) or any((p/q).exists() for q in ["figures","figs","images","img"])):
+    dirname = os.path.basename(p).lower()
+    if "manuscript" in dirname or "paper" in dirname:
         return True
+    names = _child_names(p)
+    if any(n.endswith(".tex") for n in names):
+        if any(n.endswith(".bib") for n in names) or not FIGURE_DIRS.isdisjoint(names):
+            return True
     # Word/Docx style: docx/pdf named manuscript + many figure/supp files
-    docs = list(p.glob("*manuscript*.docx")) + list(p.glob("*manuscript*.pdf")) + list(p.glob("*paper*.docx")) + list(p.glob("*paper*.pdf"))
+    docs = [n for n in names if n.endswith((".docx", ".pdf")) and ("manuscript" in n or "paper" in n)]
     if docs:
         assets = 0
         for pat in ["**/Figure*.*", "**/*Supplemental*.*", "**/*Table*.*"]:
-            assets += len(list(p.glob(pat)))
+            assets += len(list(Path(p).glob(pat)))
         if assets >= 3:
             return True
     # Overleaf common
-    if (p / "main.tex").exists():
+    if "main.tex" in names:
         return True
     return False
 
 # --------------------------- Planning ----------------------------------------
 
-def guess_category_by_rules(path: Path) -> str:
-    name = path.name.lower()
+def guess_category_by_rules(path: str) -> str:
+    name = os.path.basename(path).lower()
     if name in AUTOFILE_CONFIG_NAMES:
         return "ignore"    
-    suffix = path.suffix.lower()
-    text = name
-
-    proposal_kw = ["specific aims", "aims", "proposal", "grant", "biosketch", "narrative", "cover letter"]
-    admin_kw = ["irb", "mta", "dua", "du a", "nda", "budget", "invoice", "contract", "ica", "agreement", "ethics"]
-    manus_kw = ["manuscript", "paper", "ms", "draft", "submission", "rebuttal", "overleaf"]
-    talk_kw = ["slides", "talk", "poster", "deck", "seminar", "colloquium", "keynote"]
-    figure_kw = ["figure", "fig ", "fig_", "supplemental figure", "supp fig"]
-    supp_kw   = ["supplemental", "supp", "suppl"]
-    table_kw  = ["table", "supplemental table", "supp table"]
+    suffix = name_suffix(name)
 
 # Figures/tables/supplemental assets => manuscript
 
-    if suffix in {".pdf",".tif",".tiff",".png",".jpg",".jpeg",".svg",".eps"}:
-        if any(k in text for k in figure_kw + supp_kw + table_kw):
+    if suffix in FIGURE_EXT:
+        if ASSET_RE.search(name):
             return "manuscript"
-    if any(k in text for k in proposal_kw):
+    if PROPOSAL_RE.search(name):
         return "proposals"
-    if any(k in text for k in admin_kw):
+    if ADMIN_RE.search(name):
         return "admin"
-    if suffix in CODE_EXT:
-        return "code"
-    if suffix in DATA_EXT:
-        return "data"
-    if any(k in text for k in talk_kw) or suffix in TALKS_EXT:
+    ext_cat = EXT_TO_CATEGORY.get(suffix)
+    if ext_cat in ("code", "data"):
+        return ext_cat
+    # talk keywords still beat a manuscript extension (e.g. "talk notes.docx")
+    if ext_cat == "talks" or TALK_RE.search(name):
         return "talks"
-    if any(k in text for k in manus_kw) or suffix in MANUSCRIPT_EXT:
+    if ext_cat == "manuscript" or MANUS_RE.search(name):
         return "manuscript"
     if name in {".ds_store","thumbs.db"} or name.endswith("~"):
         return "ignore"
     return "unknown"
 
 def build_llm_messages(records, include_content: bool, peek_bytes: int):
-    examples = []
+    # Single-letter keys (see SYSTEM_PROMPT) keep the prompt small
+    files = []
     for rec in records:
         d = {
             "id": rec["id"],
-            "name": rec["name"],
-            "ext": rec["ext"],
-            "size_bytes": rec["size_bytes"],
-            "parents": rec["parents"],
-            "rule_guess": rec["rule_guess"],
+            "n": rec["name"],
+            "e": rec["ext"],
+            "s": rec["size_bytes"],
+            "p": "/".join(rec["parents"][-2:]),
+            "g": rec["rule_guess"],
         }
         if include_content and rec.get("text_preview"):
-            d["text_preview"] = rec["text_preview"]
-        examples.append(d)
+            d["t"] = rec["text_preview"][:peek_bytes]
+        files.append(d)
 
     user_prompt = {
         "role": "user",
         "content": (
-            "Classify the following files. Return JSONL, one object per entry.\n"
-            + json.dumps(examples, ensure_ascii=False)
+            "Classify the following files. Return one JSON object with a results array.\n"
+            + _dumps({"files": files})
         ),
     }
     return [{"role":"system", "content": SYSTEM_PROMPT}, user_prompt]
 
-def parse_assistant_jsonl(text: str):
+def _try_loads(text: str):
+    try:
+        return _loads(text)
+    except Exception:
+        return None
+
+def _salvage_results(text: str):
+    # A reply cut off mid-array (max_tokens): keep every complete {...} entry of "results"
+    start = text.find('"results"')
+    i = text.find("[", start) if start != -1 else -1
+    if i == -1:
+        return []
+    decoder = json.JSONDecoder()
     out = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
+    i += 1
+    while True:
+        while i < len(text) and text[i] in " \t\r\n,":
+            i += 1
+        if i >= len(text) or text[i] != "{":
+            break
         try:
-            obj = json.loads(line)
+            obj, i = decoder.raw_decode(text, i)
+        except ValueError:
+            break
+        if isinstance(obj, dict):
             out.append(obj)
-        except Exception:
-            start = line.find("{")
-            end = line.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                snippet = line[start:end+1]
-                try:
-                    obj = json.loads(snippet)
-                    out.append(obj)
-                except Exception:
-                    pass
     return out
 
-def scan_dump(dump: Path, ignore_dirs: set[str], bundle_code: bool, bundle_manuscript: bool):
-    # Identify bundle roots and collect files
-    bundle_roots = []  # list of (path, category)
-    for root, dirs, files in os.walk(dump):
-        p = Path(root)
-        # prune ignored dirs
-        dirs[:] = [d for d in dirs if d not in ignore_dirs]
-        # detect bundles at this level
-        if bundle_code and is_code_repo_root(p):
-            bundle_roots.append((p, "code"))
-            dirs[:] = []  # don't descend further; we'll handle as bundle
+def parse_assistant_results(text: str):
+    obj = _try_loads(text)
+    if obj is None:
+        # tolerate reasoning preambles (<think>...</think>) or prose around the object
+        start = text.find("{")
+        end = text.rfind("}")
+        if start != -1 and end > start:
+            obj = _try_loads(text[start:end+1])
+    if isinstance(obj, dict) and isinstance(obj.get("results"), list):
+        return obj["results"]
+    salvaged = _salvage_results(text)
+    if salvaged:
+        return salvaged
+
+    # Models that ignore the schema and answer in JSONL: decode all lines in one call,
+    # and only go line by line if some line is broken.
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip().startswith("{")]
+    objs = _try_loads("[" + ",".join(lines) + "]") if lines else None
+    if objs is None:
+        objs = [_try_loads(ln) for ln in lines]
+    objs = [o for o in objs if isinstance(o, dict)]
+    for o in objs:
+        if isinstance(o.get("results"), list):
+            return o["results"]  # the results object, on its own line after other text
+    return objs
+
+def iter_entries(root: str, ignore_dirs: set[str], bundle_detectors):
+    """Walk `root` with os.scandir.
+
+    Each directory is read once by the walk, plus once more by `_child_names` when
+    bundle detectors are given. Every yielded file costs one stat (DirEntry.stat()
+    is a syscall on Linux; its result is reused downstream instead of a second stat).
+
+    Yields ("bundle", path, category) for directories matched by one of
+    `bundle_detectors` (a list of (category, predicate) pairs) without descending
+    into them, and ("file", path, stat_result) for every other file.
+    """
+    stack = deque([os.fspath(root)])
+    while stack:
+        p = stack.pop()
+        cat = next((c for c, detect in bundle_detectors if detect(p)), None)
+        if cat:
+            yield "bundle", p, cat
             continue
-        if bundle_manuscript and is_manuscript_root(p):
-            bundle_roots.append((p, "manuscript"))
-            dirs[:] = []  # treat as bundle
+        try:
+            it = os.scandir(p)
+        except OSError:
             continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignore_dirs:
+                            stack.append(entry.path)
+                        continue
+                    if entry.is_symlink() and entry.is_dir():
+                        continue  # os.walk never descended symlinked dirs either
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield "file", entry.path, st
+
+def scan_dump(dump: Path, ignore_dirs: set[str], bundle_code: bool, bundle_manuscript: bool, on_file=None):
+    # Identify bundle roots and collect (path, stat) for files outside them;
+    # on_file(path, stat), if given, is called as each loose file is found
+    _child_names.cache_clear()
+    detectors = []
+    if bundle_code:
+        detectors.append(("code", is_code_repo_root))
+    if bundle_manuscript:
+        detectors.append(("manuscript", is_manuscript_root))
 
-    # Files not inside a bundle
+    bundle_roots = []  # list of (path, category)
+    bundle_files = []  # list of (path, category, bundle root)
     files = []
-    for root, dirs, fns in os.walk(dump):
-        p = Path(root)
-        dirs[:] = [d for d in dirs if d not in ignore_dirs]
-        # skip bundle subtrees
-        if any(str(p).startswith(str(br[0])) for br in bundle_roots):
-            continue
-        for fn in fns:
-            fp = Path(root) / fn
-            if fp.name.lower() in AUTOFILE_CONFIG_NAMES:
-                continue
-            files.append(fp)
-
-    return bundle_roots, files
-
-def plan_ai(dump: Path, api_base: str, model: str, batch_size: int, include_content: bool, peek_bytes: int, ignore_dirs: set[str], bundle_code: bool, bundle_manuscript: bool):
-    bundle_roots, files = scan_dump(dump, ignore_dirs, bundle_code, bundle_manuscript)
+    for kind, p, info in iter_entries(dump, ignore_dirs, detectors):
+        if kind == "bundle":
+            bundle_roots.append((p, info))
+            # enumerate members now so nothing has to walk this subtree again
+            for _, fp, _ in iter_entries(p, ignore_dirs, ()):
+                bundle_files.append((fp, info, p))
+        elif os.path.basename(p).lower() not in AUTOFILE_CONFIG_NAMES:
+            files.append((p, info))
+            if on_file is not None:
+                on_file(p, info)
+
+    return bundle_roots, files, bundle_files
+
+def plan_ai(dump: Path, api_base: str, model: str, batch_size: int, include_content: bool, peek_bytes: int, ignore_dirs: set[str], bundle_code: bool, bundle_manuscript: bool, concurrency: int = 4, use_cache: bool = True):
+    # Text previews are read on a thread pool while the scan is still walking the tree
+    previews = {}
+    preview_pool = ThreadPoolExecutor(max_workers=16)
+
+    def queue_preview(p, st):
+        if include_content and is_textlike(p):
+            previews[p] = preview_pool.submit(preview_text, p, peek_bytes, st.st_size)
+
+    bundle_roots, files, bundle_files = scan_dump(dump, ignore_dirs, bundle_code, bundle_manuscript, on_file=queue_preview)
 
     # Build per-file records for non-bundle files
     records = []
-    for i, p in enumerate(sorted(files)):
-        parents = list(Path(safe_relpath(p.parent, dump)).parts)
+    dump_str = str(dump)
+    for i, (p, st) in enumerate(sorted(files, key=lambda f: f[0])):
+        rel_dir = os.path.relpath(os.path.dirname(p), dump_str)
+        name = os.path.basename(p)
         rec = {
             "id": f"f{i}",
-            "path": str(p),
-            "name": p.name,
-            "ext": p.suffix.lower(),
-            "size_bytes": p.stat().st_size if p.exists() else 0,
-            "parents": parents,
+            "path": p,
+            "name": name,
+            "ext": name_suffix(name).lower(),
+            "size_bytes": st.st_size,
+            "parents": [] if rel_dir == "." else rel_dir.split(os.sep),
             "rule_guess": guess_category_by_rules(p),
-            "text_preview": preview_text(p, 2000) if include_content and is_textlike(p) else "",
+            "text_preview": previews[p].result() if p in previews else "",
+            "cache_key": decision_cache_key(p, os.path.join(rel_dir, name), st, model, include_content) if use_cache else "",
         }
         records.append(rec)
+    preview_pool.shutdown()
 
     decisions = {}
 
-    # Call LLM in batches
-    for i in range(0, len(records), batch_size):
-        batch = records[i:i+batch_size]
-        messages = build_llm_messages(batch, include_content, 2000)
-        try:
-            resp = post_chat_completion(api_base, model, messages, timeout=120)
-            content = resp["choices"][0]["message"]["content"]
-            objs = parse_assistant_jsonl(content)
-            by_id = {o.get("id"): o for o in objs if isinstance(o, dict)}
-        except Exception as e:
-            print(f"[WARN] LLM call failed for batch starting {i}: {e}\nFalling back to rule-based for this batch.")
-            by_id = {}
-
-        for rec in batch:
-            o = by_id.get(rec["id"])
-            if not o or o.get("category") not in CATEGORY_KEYS:
-                o = {"id": rec["id"], "category": rec["rule_guess"], "confidence": 0.65, "reason": "rule-based fallback", "rename": ""}
-            # upgrade unknown by extension rules
-            if o["category"] in {"unknown","ignore"}:
+    # Reuse earlier decisions for unchanged files; only the rest go to the LLM
+    cache = open_decision_cache() if use_cache else None
+    need_llm = []
+    for rec in records:
+        row = None
+        if cache is not None and rec["cache_key"]:
+            row = cache.execute("SELECT decision FROM cache WHERE key = ?", (rec["cache_key"],)).fetchone()
+        if row:
+            decisions[rec["path"]] = {"id": rec["id"], **_loads(row[0])}
+        else:
+            decisions[rec["path"]] = None  # filled in below; keeps plan order stable
+            need_llm.append(rec)
+    if cache is not None:
+        print(f"[AutoFile] Decision cache: {len(records) - len(need_llm)} hits, {len(need_llm)} to classify")
+
+    def classify(batch):
+        messages = build_llm_messages(batch, include_content, peek_bytes)
+        resp = post_chat_completion(api_base, model, messages, timeout=120,
+                                    max_tokens=max(MIN_REPLY_TOKENS, TOKENS_PER_RESULT * len(batch)))
+        content = resp["choices"][0]["message"]["content"]
+        objs = parse_assistant_results(content)
+        return {o.get("id"): o for o in objs if isinstance(o, dict)}
+
+    # Call LLM in batches, several in flight at once; results are consumed in batch order
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+        batches = [(i, need_llm[i:i+batch_size]) for i in range(0, len(need_llm), batch_size)]
+        futures = [(i, batch, ex.submit(classify, batch)) for i, batch in batches]
+
+        for i, batch, fut in futures:
+            try:
+                by_id = fut.result()
+            except Exception as e:
+                print(f"[WARN] LLM call failed for batch starting {i}: {e}\nFalling back to rule-based for this batch.")
+                by_id = {}
+
+            fresh = []
+            for rec in batch:
+                o = by_id.get(rec["id"])
                 rb = rec["rule_guess"]
-                if rb in {"data","code","manuscript","talks","proposals","admin"}:
+                if not o or o.get("category") not in CATEGORY_KEYS:
+                    o = dict(FALLBACK_DECISIONS[rb], id=rec["id"])
+                elif rec["cache_key"]:
+                    fresh.append((rec["cache_key"], o))
+                # upgrade unknown by extension rules (a fallback already carries the rule guess)
+                if o["category"] in UNSURE_CATEGORIES and rb in UPGRADE_CATEGORIES:
                     o["category"] = rb
-                    o["reason"] = (o.get("reason","") + " | upgraded by extension rule").strip()
-            decisions[rec["path"]] = o
+                    o["reason"] = (o.get("reason","") + UPGRADE_NOTE).strip()
+                decisions[rec["path"]] = o
+
+            # only model answers are cached, never the rule-based fallback
+            if cache is not None and fresh:
+                with cache:
+                    cache.executemany(
+                        "INSERT OR REPLACE INTO cache (key, decision) VALUES (?, ?)",
+                        [(k, _dumps({f: v for f, v in o.items() if f != "id"})) for k, o in fresh],
+                    )
+
+    if cache is not None:
+        cache.close()
 
     # For bundle roots, create decisions for all contained files as the bundle category
-    bundle_items = []
-    for root, cat in bundle_roots:
-        for r, dirs, fns in os.walk(root):
-            pr = Path(r)
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
-            for fn in fns:
-                fp = pr / fn
-                decisions[str(fp)] = {"id": None, "category": cat, "confidence": 0.99, "reason": f"{cat} bundle root at {root}", "rename": ""}
-                bundle_items.append(fp)
+    for fp, cat, root in bundle_files:
+        decisions[fp] = {"id": None, "category": cat, "confidence": 0.99, "reason": f"{cat} bundle root at {root}", "rename": ""}
 
     return records, decisions, bundle_roots
 
 # --------------------------- Applying ----------------------------------------
 
-def apply_plan(records, decisions, dump: Path, project_dir: Path, source_label: str, move: bool, quarantine_threshold: float):
+def place_file(src: str, dest: str, st, move: bool, hardlink: bool, same_dev: bool):
+    # same filesystem: rename/link are a single inode update instead of a data copy
+    if move:
+        if same_dev:
+            try:
+                os.rename(src, dest)
+                return
+            except OSError:
+                pass
+        shutil.move(src, dest)
+        return
+    if hardlink and same_dev:
+        try:
+            os.link(src, dest)
+            return
+        except FileExistsError:
+            os.unlink(dest)
+            os.link(src, dest)
+            return
+        except OSError:
+            pass  # e.g. filesystem without hard links; fall through to a copy
+    # copyfile takes the sendfile/fcopyfile fast path; restore mode and times from the stat we have
+    shutil.copyfile(src, dest)
+    os.chmod(dest, stat.S_IMODE(st.st_mode))
+    os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def apply_plan(records, decisions, dump: Path, project_dir: Path, source_label: str, move: bool, quarantine_threshold: float, hardlink: bool = False, copy_workers: int = 8):
     today = _dt.date.today().strftime("%Y%m%d")
     label = source_label or "collab"
 
@@ -432,78 +723,90 @@ def apply_plan(records, decisions, dump: Path, project_dir: Path, source_label:
     # add a run id / timestamp for this batch
     batch_id = datetime.now().isoformat(timespec="seconds")
     
-    # write plan jsonl (decisions for all known paths)
-    all_paths = sorted({str(Path(dump) / safe_relpath(Path(k), dump)) for k in decisions.keys()})
-    with plan_jsonl.open("w", encoding="utf-8") as f:
-        for path in all_paths:
-            dec = decisions.get(str(Path(path)), {})
+    # write plan jsonl (decisions for all known paths; keys are already absolute paths under dump)
+    with plan_jsonl.open("wb") as f:
+        for path in sorted(decisions):
+            dec = decisions[path]
             dec["path"] = path
-            f.write(json.dumps(dec, ensure_ascii=False) + "\n")
+            f.write(_dumps_line(dec))
 
     moved = 0
     skipped = 0
-    rows = []
+    same_dev = os.stat(dump).st_dev == os.stat(project_dir).st_dev
+
+    # manifest CSV: APPEND instead of overwrite; header only if the file is new
+    # (append mode opens at the end, so an empty file is at offset 0).
+    # Rows are streamed as files are placed rather than collected first.
+    FIELDS = ("batch_id","original_path","new_path","category","confidence","reason","bytes")
+    with manifest_csv.open("a", newline="", encoding="utf-8") as mf:
+        writer = csv.writer(mf)
+        if mf.tell() == 0:
+            writer.writerow(FIELDS)
+
+        # pass 1 (serial): resolve destinations and create their folders
+        # plain strings from here on: decision keys already are, and this loop runs per file
+        dump_prefix = os.path.join(str(dump), "")
+        bases = {k: str(v) for k, v in dests.items() if v is not None}
+        jobs = []
+        parent_dirs = set()
+        for path, dec in decisions.items():
+            if os.path.basename(path).lower() in AUTOFILE_CONFIG_NAMES:
+                skipped += 1
+                continue
 
-    for path, dec in decisions.items():
-        src = Path(path)
-        if src.name.lower() in AUTOFILE_CONFIG_NAMES:
-            skipped += 1
-            continue
+            cat = dec.get("category","unknown")
+            conf = float(dec.get("confidence", 0) or 0)
+            # quarantine
+            if cat != "ignore" and conf < quarantine_threshold:
+                cat = "unknown"
+            if cat == "ignore":
+                skipped += 1
+                continue
 
-        cat = dec.get("category","unknown")
-        conf = float(dec.get("confidence", 0) or 0)
-        # quarantine
-        if cat != "ignore" and conf < quarantine_threshold:
-            cat = "unknown"
-        if cat == "ignore":
-            skipped += 1
-            continue
+            base = bases.get(cat) or bases["unknown"]
+            rel = path[len(dump_prefix):] if path.startswith(dump_prefix) else os.path.basename(path)
+            rename = (dec.get("rename") or "").strip()
+            if rename:
+                rename = rename.replace("/", "-").replace("\\", "-")
+                rel = os.path.join(os.path.dirname(rel), rename)
+
+            dest = os.path.join(base, rel)
+            parent_dirs.add(os.path.dirname(dest))
+            jobs.append((path, dest, cat, conf, dec.get("reason","")))
+
+        # one mkdir per distinct folder (not per file), shallowest first
+        for d in sorted(parent_dirs, key=lambda d: d.count(os.sep)):
+            os.makedirs(d, exist_ok=True)
+
+        # pass 2 (parallel): the copies/moves themselves; rows still land in plan order.
+        # A failing file is recorded and the rest carry on, so every file that did
+        # land still gets its manifest row and the log is written.
+        def place(job):
+            src, dest = job[0], job[1]
+            try:
+                st = os.stat(src)
+                place_file(src, dest, st, move, hardlink, same_dev)
+            except Exception as e:
+                return None, e
+            return st.st_size, None
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=max(1, copy_workers)) as ex:
+            for (src, dest, cat, conf, reason), (size, err) in zip(jobs, ex.map(place, jobs)):
+                if err is not None:
+                    failed.append((src, err))
+                    continue
+                moved += 1
+                writer.writerow((batch_id, src, dest, cat, conf, reason, size))
 
-        base = dests.get(cat) or dests["unknown"]
-        rel = safe_relpath(src, dump)
-        rename = (dec.get("rename") or "").strip()
-        if rename:
-            rename = rename.replace("/", "-").replace("\\", "-")
-            rel = rel.parent / rename
-
-        dest = base / rel
-        ensure_dir(dest.parent)
-        if move:
-            shutil.move(str(src), str(dest))
-        else:
-            shutil.copy2(str(src), str(dest))
-        moved += 1
-        rows.append({
-            "original_path": str(src),
-            "new_path": str(dest),
-            "category": cat,
-            "confidence": conf,
-            "reason": dec.get("reason",""),
-            "bytes": dest.stat().st_size if dest.exists() else "",
-        })
-
-    # write manifest CSV
-    # APPEND instead of overwrite; write header only if file is new
-
-    for r in rows:
-        r["batch_id"] = batch_id
-        
-    # use a stable field order
-    FIELDS = ["batch_id","original_path","new_path","category","confidence","reason","bytes"]
-
-    write_header = not manifest_csv.exists()
-    with manifest_csv.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDS)
-        if write_header:
-            writer.writeheader()
-        writer.writerows(rows)
-    
     # write summary log
     header = f"# AutoFile Intake {today} from {label}\n\n"
-    header += f"Mode: {'MOVE' if move else 'COPY'}\n\n"
+    header += f"Mode: {'MOVE' if move else 'HARDLINK' if hardlink else 'COPY'}\n\n"
     header += f"Plan: `{plan_jsonl.name}`\n\n"
     header += f"Manifest: `{manifest_csv.name}`\n\n"
     header += f"Moved {moved} files; skipped {skipped} ignored items.\n\n"
+    if failed:
+        header += f"Failed to place {len(failed)} files:\n" + "\n".join([f"- {src}: {err}" for src, err in failed]) + "\n\n"
     with log_md.open("a", encoding="utf-8") as f:
         f.write(header)
 
@@ -514,18 +817,22 @@ def apply_plan(records, decisions, dump: Path, project_dir: Path, source_label:
     # keep the skeleton in place (no .keep files needed)
     ensure_project_skeleton(project_dir)
 
+    if failed:
+        for src, err in failed:
+            print(f"[WARN] Could not place {src}: {err}")
+        raise SystemExit(f"[AutoFile] {len(failed)} files could not be placed; the rest are in {manifest_csv}")
+
     return plan_jsonl, manifest_csv, log_md
 
 # --------------------------- Auto-intake helper -------------------------------
 
 def load_autofile_json(p: Path) -> dict:
     for name in [".autofile.json","autofile.json","_autofile.json"]:
-        cfg = p / name
-        if cfg.exists():
-            try:
-                return json.loads(cfg.read_text(encoding="utf-8"))
-            except Exception:
-                pass
+        # missing and unreadable configs both fall through to the next name
+        try:
+            return json.loads((p / name).read_text(encoding="utf-8"))
+        except Exception:
+            pass
     return {}
 
 # --------------------------- CLI ---------------------------------------------
@@ -541,12 +848,16 @@ def main():
     ap.add_argument("--base", default="~/Documents", help="Base documents directory (default: ~/Documents)")
     ap.add_argument("--apply", action="store_true", help="Actually copy/move files into the project (default is dry-run to only create a plan)")
     ap.add_argument("--move", action="store_true", help="Move files instead of copying (destructive)")
+    ap.add_argument("--copy-workers", type=int, default=8, help="Files copied/moved in parallel during --apply (use 1 on spinning disks)")
+    ap.add_argument("--hardlink", action="store_true", help="Hard-link instead of copying when the dump is on the same filesystem as the project")
 
     ap.add_argument("--api-base", default=os.environ.get("LMSTUDIO_API_BASE", DEFAULT_API_BASE), help="OpenAI-style API base, e.g., http://127.0.0.1:1234/v1")
     ap.add_argument("--model", default=os.environ.get("LMSTUDIO_MODEL", DEFAULT_MODEL), help="Model name as exposed by LM Studio")
     ap.add_argument("--batch-size", type=int, default=40, help="Files per LLM call (reduce if you see OOM/timeouts)")
+    ap.add_argument("--concurrency", type=int, default=4, help="LLM batches in flight at once (use 1 if the server handles one request at a time)")
     ap.add_argument("--peek-bytes", type=int, default=2000, help="Max text bytes per file to send")
     ap.add_argument("--no-content", action="store_true", help="Do NOT send any file contents to the model (metadata only)")
+    ap.add_argument("--no-cache", action="store_true", help=f"Ignore and do not update the decision cache ({DEFAULT_CACHE_PATH})")
 
     ap.add_argument("--bundle", default="code,manuscript", help="Comma list: code,manuscript,none")
     ap.add_argument("--ignore-dirs", default=",".join(sorted(DEFAULT_IGNORE_DIRS)), help="Comma list of directories to skip")
@@ -569,6 +880,7 @@ def main():
         source = cfg.get("source") or args.source or "collab"
         apply_flag = cfg.get("apply", False) or args.apply
         move_flag = cfg.get("move", False) or args.move
+        hardlink_flag = cfg.get("hardlink", False) or args.hardlink
         use_ai = cfg.get("use_ai", True)
         bundle_list = cfg.get("bundle", [])
         bundle_code = ("code" in bundle_list) if bundle_list else ("code" in (args.bundle or ""))
@@ -584,13 +896,13 @@ def main():
         ignore_dirs = {d for d in ignore_dirs if d}
 
         if use_ai:
-            records, decisions, bundle_roots = plan_ai(drop, args.api_base, args.model, args.batch_size, not args.no_content, args.peek_bytes, ignore_dirs, bundle_code, bundle_manuscript)
+            records, decisions, bundle_roots = plan_ai(drop, args.api_base, args.model, args.batch_size, not args.no_content, args.peek_bytes, ignore_dirs, bundle_code, bundle_manuscript, concurrency=args.concurrency, use_cache=not args.no_cache)
         else:
             # Rule-only plan
-            _, files = scan_dump(drop, ignore_dirs, bundle_code, bundle_manuscript)
+            _, files, _ = scan_dump(drop, ignore_dirs, bundle_code, bundle_manuscript)
             records = []
             decisions = {}
-            for p in files:
+            for p, _ in files:
                 cat = guess_category_by_rules(p)
                 decisions[str(p)] = {"id": None, "category": cat, "confidence": 0.5, "reason": "rule-based only", "rename": ""}
             bundle_roots = []
@@ -598,15 +910,15 @@ def main():
         # Always write a plan jsonl (dry-run output)
         today = _dt.date.today().strftime("%Y%m%d")
         plan_jsonl = project_dir / f"autofile_plan_{source}_{today}.jsonl"
-        with plan_jsonl.open("w", encoding="utf-8") as f:
+        with plan_jsonl.open("wb") as f:
             for path, dec in decisions.items():
                 o = dict(dec)
                 o["path"] = path
-                f.write(json.dumps(o, ensure_ascii=False) + "\n")
+                f.write(_dumps_line(o))
         print(f"[AutoFile] Plan written: {plan_jsonl}")
         if apply_flag:
             print("[AutoFile] Applying...")
-            plan_jsonl, manifest_csv, log_md = apply_plan(records, decisions, drop, project_dir, source, move_flag, quarantine)
+            plan_jsonl, manifest_csv, log_md = apply_plan(records, decisions, drop, project_dir, source, move_flag, quarantine, hardlink=hardlink_flag, copy_workers=args.copy_workers)
             print(f"Applied. Manifest: {manifest_csv}")
             print(f"Summary: {log_md}")
         else:
@@ -634,22 +946,23 @@ def main():
 
     print(f"[AutoFile] Planning intake for {dump} into {project_dir.name} using {args.model} @ {args.api_base}")
     records, decisions, bundle_roots = plan_ai(
-        dump, args.api_base, args.model, args.batch_size, not args.no_content, args.peek_bytes, ignore_dirs, bundle_code, bundle_manuscript
+        dump, args.api_base, args.model, args.batch_size, not args.no_content, args.peek_bytes, ignore_dirs, bundle_code, bundle_manuscript,
+        concurrency=args.concurrency, use_cache=not args.no_cache,
     )
 
     today = _dt.date.today().strftime("%Y%m%d")
     plan_jsonl = project_dir / f"autofile_plan_{args.source or 'collab'}_{today}.jsonl"
-    with plan_jsonl.open("w", encoding="utf-8") as f:
+    with plan_jsonl.open("wb") as f:
         for path, dec in decisions.items():
             o = dict(dec)
             o["path"] = path
-            f.write(json.dumps(o, ensure_ascii=False) + "\n")
+            f.write(_dumps_line(o))
     print(f"[AutoFile] Wrote plan: {plan_jsonl}")
     print("[AutoFile] Dry run only. Use --apply to execute the plan.")
 
     if args.apply:
         print("[AutoFile] Applying...")
-        plan_jsonl, manifest_csv, log_md = apply_plan(records, decisions, dump, project_dir, args.source or "collab", move=args.move, quarantine_threshold=args.quarantine_threshold)
+        plan_jsonl, manifest_csv, log_md = apply_plan(records, decisions, dump, project_dir, args.source or "collab", move=args.move, quarantine_threshold=args.quarantine_threshold, hardlink=args.hardlink, copy_workers=args.copy_workers)
         print(f"Applied. Manifest: {manifest_csv}")
         print(f"Summary: {log_md}")
 
@@ -12,8 +12,12 @@ Usage:
 
   # Ingest a collaborator dump into an existing project (copy by default)
   python new_project.py --intake "/path/to/dump" --project "2025-CRISPR-MutSim" --source "AliceLab"
-  # Move instead of copy (dangerous, faster)
+  # Move instead of copy (dangerous; metadata-only rename when on the same filesystem)
   python new_project.py --intake "/path/to/dump" --project "2025-CRISPR-MutSim" --move
+  # Place files with 8 worker threads (0 = auto; default 1 = sequential)
+  python new_project.py --intake "/path/to/dump" --project "2025-CRISPR-MutSim" --jobs 8
+  # Tune I/O for the storage: 4 MiB reads, 128-file prefetch batches (e.g. a NAS)
+  python new_project.py --intake "/path/to/dump" --project "2025-CRISPR-MutSim" --io-chunk 4194304 --io-batch 128
   # Base location for everything (defaults to ~/Documents)
   python new_project.py --intake "/dump" --project "2025-CRISPR-MutSim" --base "~/Dropbox/Documents"
 
@@ -38,12 +42,21 @@ It writes:
 """
 import argparse
 import datetime as _dt
+import errno
+import functools
 import hashlib
+import mmap
 import os
+import re
 from pathlib import Path
 import shutil
 import sys
 import csv
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 
 BASE_FOLDERS = ["Teaching", "Research", "Service", "Personal", "Fun"]
@@ -137,10 +150,13 @@ def bootstrap(base_dir: Path, owner: str = "", quiet: bool = False):
     print(f"Bootstrapped structure under: {documents}")
     print(f"Template created at: {tmpl}")
 
+_SLUG_BAD = re.compile(r'[/\\:*?"<>|]')
+
 def slugify(name: str) -> str:
-    bad = set('/\\:*?"<>|')
-    s = name.strip().replace(" ", "-")
-    return "".join(ch for ch in s if ch not in bad)
+    return _SLUG_BAD.sub("", name.strip().replace(" ", "-"))
+
+# Placeholders left in Project_Template/README.md by bootstrap
+_README_FIELDS = re.compile(r"Project Title|<your name>")
 
 def create_project(base_dir: Path, name: str, year: int | None, owner: str = "") -> Path:
     documents = base_dir.expanduser()
@@ -160,14 +176,18 @@ def create_project(base_dir: Path, name: str, year: int | None, owner: str = "")
     if dest.exists():
         raise SystemExit(f"Destination already exists: {dest}")
 
-    shutil.copytree(tmpl, dest)
+    # Copy everything but the top-level README, which is personalized below
+    shutil.copytree(tmpl, dest, ignore=lambda d, names: ["README.md"] if Path(d) == tmpl else [])
 
-    # Personalize README
-    readme = dest / "README.md"
-    txt = readme.read_text(encoding="utf-8")
-    txt = txt.replace("Project Title", name)
-    txt = txt.replace("<your name>", owner or "")
-    readme.write_text(txt, encoding="utf-8")
+    # Personalize README in one pass over the (possibly user-edited) template
+    try:
+        txt = (tmpl / "README.md").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        txt = READ_ME.format(project_title="Project Title", owner="<your name>", status="ACTIVE",
+                             created_date=_dt.date.today().isoformat())
+    fields = {"Project Title": name, "<your name>": owner or ""}
+    txt = _README_FIELDS.sub(lambda m: fields[m.group()], txt)
+    (dest / "README.md").write_text(txt, encoding="utf-8")
 
     print(f"Created new project at: {dest}")
     return dest
@@ -182,57 +202,270 @@ CODE_EXT = {".py",".r",".ipynb",".m",".jl",".sh",".bash",".bat",".ps1",".sql",".
 MANUSCRIPT_EXT = {".tex",".bib",".doc",".docx",".rtf",".odt",".pdf"}
 TALKS_EXT = {".ppt",".pptx",".key",".pdf"}
 IMAGE_EXT = {".png",".jpg",".jpeg",".svg",".eps",".tif",".tiff",".pdf"}
-
-def categorize(path: Path):
-    name = path.name.lower()
-    stem = path.stem.lower()
-    suffix = path.suffix.lower()
-
-    text = name  # simple keyword bag
-    # Proposals first (keywords override generic manus)
-    proposal_kw = ["specific aims", "aims", "proposal", "grant", "biosketch", "narrative", "cover letter"]
-    admin_kw = ["irb", "mta", "dua", "du a", "nda", "budget", "invoice", "contract", "ica", "agreement", "ethics"]
-    manus_kw = ["manuscript", "paper", "ms", "draft", "submission", "rebuttal", "overleaf"]
-    talk_kw = ["slides", "talk", "poster", "deck", "seminar", "colloquium", "keynote"]
+# Suffixes that settle the category once the proposal/admin keywords have had their say,
+# so code and data files skip the talk/manuscript scans
+SUFFIX_CATEGORY = {**{e: "data" for e in DATA_EXT}, **{e: "code" for e in CODE_EXT}}
+
+# Keyword bags, matched as substrings of the lowercased file name
+PROPOSAL_KW = ["specific aims", "aims", "proposal", "grant", "biosketch", "narrative", "cover letter"]
+ADMIN_KW = ["irb", "mta", "dua", "du a", "nda", "budget", "invoice", "contract", "ica", "agreement", "ethics"]
+MANUS_KW = ["manuscript", "paper", "ms", "draft", "submission", "rebuttal", "overleaf"]
+TALK_KW = ["slides", "talk", "poster", "deck", "seminar", "colloquium", "keynote"]
+
+def _kw_regex(words):
+    return re.compile("|".join(map(re.escape, words)))
+
+PROPOSAL_RE = _kw_regex(PROPOSAL_KW)
+ADMIN_RE = _kw_regex(ADMIN_KW)
+MANUS_RE = _kw_regex(MANUS_KW)
+TALK_RE = _kw_regex(TALK_KW)
+
+def categorize(name: str):
+    # Only the file name matters; exact repeats (R1.fastq.gz in every sample folder) hit the cache
+    # Split like Path.suffix (not os.path.splitext, which skips leading dots: "..py" is code)
+    name = name.lower()
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return _categorize(name[i:], name[:i])
+    return _categorize("", name)
+
+@functools.lru_cache(maxsize=10_000)
+def _categorize(suffix: str, stem: str):
+    text = stem + suffix  # simple keyword bag (the lowercased name)
 
     # Category rules
-    if any(k in text for k in proposal_kw):
+    # Proposals first (keywords override generic manus)
+    if PROPOSAL_RE.search(text):
         return "proposals"
-    if any(k in text for k in admin_kw):
+    if ADMIN_RE.search(text):
         return "admin"
-    if suffix in CODE_EXT:
-        return "code"
-    if suffix in DATA_EXT:
-        return "data"
-    if any(k in text for k in talk_kw) or suffix in TALKS_EXT:
+    # Code/data suffixes decide in one lookup
+    category = SUFFIX_CATEGORY.get(suffix)
+    if category:
+        return category
+    if TALK_RE.search(text) or suffix in TALKS_EXT:
         return "talks"
-    if any(k in text for k in manus_kw) or suffix in MANUSCRIPT_EXT:
+    if MANUS_RE.search(text) or suffix in MANUSCRIPT_EXT:
         return "manuscript"
     # images that could be figures
     if suffix in IMAGE_EXT:
         return "manuscript"  # figures likely belong near manus/analysis; default to manuscript bucket
     return "unknown"
 
-def safe_relpath(child: Path, parent: Path) -> Path:
-    try:
-        return child.relative_to(parent)
-    except Exception:
-        return Path(child.name)
-
-def sha256_if_small(fp: Path, max_mb: int = 500) -> str:
+def prune_empty_children(root: Path):
+    # Remove empty dirs beneath root (but not root itself), bottom-up so parents
+    # emptied by their children go too; rmdir refuses anything non-empty.
+    top = str(root)
+    for d, _, files in os.walk(top, topdown=False):
+        if files or d == top:
+            continue
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+
+def walk_scandir(root):
+    """Yield DirEntry objects for every non-directory under root, in os.walk order.
+    Symlinked directories are listed but not followed, and unreadable directories are
+    skipped, as with os.walk."""
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif not entry.is_dir():
+                    yield entry
+        stack.extend(reversed(subdirs))
+
+HASH_CHUNK = 1 << 20  # one reusable 1 MiB read buffer per hashed file
+
+def sha256_if_small(fp: str, max_mb: int = 500, size: int | None = None) -> str:
+    # Pass a known size to skip the stat
     try:
-        size_mb = fp.stat().st_size / (1024*1024)
+        size_mb = (os.stat(fp).st_size if size is None else size) / (1024*1024)
         if size_mb > max_mb:
             return ""
-        h = hashlib.sha256()
-        with fp.open("rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
+        with open(fp, "rb", buffering=0) as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            h = hashlib.sha256()
+            buf = bytearray(HASH_CHUNK)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
         return h.hexdigest()
     except Exception:
         return ""
 
-def intake_dump(base_dir: Path, project_name: str, dump_path: Path, source_label: str = "", move: bool = False):
+MOVE_HASH_MAX = 1 << 20  # moved files above this size are not re-read just to hash them
+
+# copy_file_range/sendfile errors meaning "not supported here", so try the next method
+_NO_KERNEL_COPY = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+
+def fadvise(fd: int, advice: str):
+    # Best-effort page-cache hint for the whole file, e.g. fadvise(fd, "SEQUENTIAL").
+    # Intake reads each source once, front to back, and never again.
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, "POSIX_FADV_" + advice))
+        except OSError:
+            pass
+
+def copy_kernel(src: str, dest: str, chunk: int = HASH_CHUNK):
+    """Copy src to dest like copy2, keeping the bytes in the kernel where possible.
+    On Linux: copy_file_range (a reflink on Btrfs/XFS), then sendfile, then a plain
+    read/write loop (chunk bytes at a time). Elsewhere shutil.copy2, which uses
+    fcopyfile on macOS, where sendfile only writes to sockets."""
+    if not sys.platform.startswith("linux"):
+        shutil.copy2(src, dest)
+        return
+    with open(src, "rb") as fin, open(dest, "wb") as fout:
+        ifd, ofd = fin.fileno(), fout.fileno()
+        fadvise(ifd, "SEQUENTIAL")
+        size = os.fstat(ifd).st_size
+        done = 0
+        for name in ("copy_file_range", "sendfile"):
+            fn = getattr(os, name, None)
+            if fn is None:
+                continue
+            try:
+                while done < size:
+                    if name == "copy_file_range":
+                        n = fn(ifd, ofd, size - done)
+                    else:
+                        n = fn(ofd, ifd, None, size - done)
+                    if n == 0:
+                        break  # nothing more from this method (e.g. special files)
+                    done += n
+            except OSError as e:
+                if e.errno not in _NO_KERNEL_COPY:
+                    raise
+            if done >= size:
+                break
+        else:
+            # Both fd offsets sit at `done`; finish in userspace
+            fin.seek(done)
+            fout.seek(done)
+            shutil.copyfileobj(fin, fout, chunk)
+            fout.flush()
+        fadvise(ifd, "DONTNEED")
+        fadvise(ofd, "DONTNEED")
+    shutil.copystat(src, dest)
+
+DIRECT_MIN = 64 << 20   # data files above this are written with O_DIRECT
+DIRECT_CHUNK = 2 << 20  # O_DIRECT write size (page-aligned mmap buffer)
+DIRECT_ALIGN = 4096     # writes whose length isn't a multiple of this drop O_DIRECT
+
+def _clear_direct(fd: int) -> bool:
+    fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) & ~os.O_DIRECT)
+    return False
+
+def _copy_hashed_direct(src: str, dest: str):
+    """Hashing copy that writes dest with O_DIRECT, keeping multi-GB raw data out of the
+    page cache. Returns the digest, or None if dest's filesystem refuses O_DIRECT."""
+    try:
+        ofd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return None
+        raise
+    h = hashlib.sha256()
+    buf = mmap.mmap(-1, DIRECT_CHUNK)  # anonymous maps are page-aligned
+    view = memoryview(buf)
+    direct = True
+    try:
+        with open(src, "rb", buffering=0) as fin:
+            fadvise(fin.fileno(), "SEQUENTIAL")
+            while n := fin.readinto(buf):
+                chunk = view[:n]
+                h.update(chunk)
+                if direct and n % DIRECT_ALIGN:
+                    direct = _clear_direct(ofd)  # unaligned tail goes through the page cache
+                off = 0
+                while off < n:
+                    try:
+                        off += os.write(ofd, chunk[off:])
+                    except OSError as e:
+                        if not (direct and e.errno == errno.EINVAL):
+                            raise
+                        direct = _clear_direct(ofd)  # accepted at open, refused on write
+                        continue
+                    if off < n and direct:
+                        direct = _clear_direct(ofd)  # short write left us unaligned
+            fadvise(fin.fileno(), "DONTNEED")
+        os.fsync(ofd)
+        fadvise(ofd, "DONTNEED")  # the buffered tail
+    finally:
+        os.close(ofd)
+    return h.hexdigest()
+
+def copy_hashed(src: str, dest: str, max_mb: int = 500, direct: bool = False,
+                size: int | None = None, chunk: int = HASH_CHUNK) -> str:
+    """Copy src to dest like copy2, hashing the bytes as they stream through.
+    Returns the SHA-256 hex digest, or "" for files larger than max_mb (copied unhashed).
+    direct=True writes files above DIRECT_MIN with O_DIRECT where the platform allows.
+    Pass the source size if it is already known to skip the stat."""
+    if size is None:
+        size = os.stat(src).st_size
+    if size > max_mb * 1024 * 1024:
+        # Too big to hash; let the kernel move the bytes
+        copy_kernel(src, dest, chunk)
+        return ""
+    if direct and size > DIRECT_MIN and fcntl and hasattr(os, "O_DIRECT"):
+        digest = _copy_hashed_direct(src, dest)
+        if digest is not None:
+            shutil.copystat(src, dest)
+            return digest
+    h = hashlib.sha256()
+    buf = bytearray(chunk)
+    view = memoryview(buf)
+    with open(src, "rb", buffering=0) as fin, open(dest, "wb") as fout:
+        fadvise(fin.fileno(), "SEQUENTIAL")
+        while n := fin.readinto(buf):
+            piece = view[:n]
+            h.update(piece)
+            fout.write(piece)
+        fout.flush()
+        fadvise(fin.fileno(), "DONTNEED")
+        fadvise(fout.fileno(), "DONTNEED")
+    shutil.copystat(src, dest)
+    return h.hexdigest()
+
+# Files whose reads are queued together before copying (--io-batch). Bigger batches
+# overlap more reads and suit slow or networked disks; smaller ones keep the delay
+# before the first copy, and per-file latency, down on fast SSDs.
+IO_BATCH = 64
+
+def prefetch(paths, nbytes: int = HASH_CHUNK):
+    # nbytes: readahead requested per file, one read chunk by default
+    # Ask the kernel to start reading every source in a batch before we copy any of
+    # them, so their first reads overlap instead of waiting one file at a time.
+    if not hasattr(os, "posix_fadvise"):
+        return  # e.g. macOS; copies still work, just without the readahead hint
+    for p in paths:
+        try:
+            fd = os.open(p, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, nbytes, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+# Dumps below both limits are placed with the plain sequential loop
+SIMPLE_MAX_FILES = 32
+SIMPLE_MAX_BYTES = 16 << 20
+
+def intake_dump(base_dir: Path, project_name: str, dump_path: Path, source_label: str = "", move: bool = False,
+                jobs: int = 1, io_chunk: int = HASH_CHUNK, io_batch: int = IO_BATCH):
     documents = base_dir.expanduser()
     projects = documents / "Research" / "Projects"
     project_dir = projects / project_name
@@ -257,6 +490,15 @@ def intake_dump(base_dir: Path, project_name: str, dump_path: Path, source_label
     }
     for d in dests.values():
         ensure_dir(d)
+    # Plain-string bases so the per-file loop does str joins, not Path arithmetic
+    dests_str = {k: os.fspath(v) for k, v in dests.items()}
+    # Parent dirs already created this run; most files share a handful of them
+    ensured = set(dests_str.values())
+
+    def ensure_parent(p: str):
+        if p not in ensured:
+            os.makedirs(p, exist_ok=True)
+            ensured.add(p)
 
     # Ensure data README exists under the new raw/ bucket
     data_readme = dests["data"].parent / "README_data.md"
@@ -266,40 +508,101 @@ def intake_dump(base_dir: Path, project_name: str, dump_path: Path, source_label
             encoding="utf-8",
         )
 
-    # Walk dump and place files
-    manifest_rows = []
-    for root, dirs, files in os.walk(dump):
-        for fname in files:
-            src = Path(root) / fname
-            category = categorize(src)
-            # Preserve relative layout under a category bucket
-            rel = safe_relpath(src, dump)
-            dest_base = dests.get(category, dests["unknown"])
-            dest = dest_base / rel
-            ensure_dir(dest.parent)
-
+    # Walk dump and plan placements
+    placements = []
+    dump_str = os.fspath(dump)
+    prefix_len = len(os.path.join(dump_str, ""))
+    unknown_base = dests_str["unknown"]
+    if dump.is_file():
+        # A single attachment rather than a folder: it lands directly in its bucket
+        category = categorize(dump.name)
+        dest = os.path.join(dests_str.get(category, unknown_base), dump.name)
+        placements.append((dump_str, dest, category, dump.stat().st_size))
+    else:
+        for entry in walk_scandir(dump_str):
+            src = entry.path
+            category = categorize(entry.name)
+            # Preserve relative layout under a category bucket (entries all sit under dump_str)
+            rel = src[prefix_len:]
+            dest = os.path.join(dests_str.get(category, unknown_base), rel)
+            # Source size from the scan; copy/move leaves it unchanged, so no dest stat later
+            placements.append((src, dest, category, entry.stat().st_size))
+
+    # A move on one filesystem is a plain rename per file. Across filesystems we
+    # copy like a normal intake and unlink each source once its copy has landed.
+    rename = move and os.stat(dump).st_dev == os.stat(project_dir).st_dev
+
+    def place(job):
+        src, dest, category, size = job
+        ensure_parent(os.path.dirname(dest))
+
+        if rename:
+            try:
+                os.rename(src, dest)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(src, dest)  # another mount nested inside the dump
+            # Small files are cheap to hash; big ones were only renamed, skip the re-read
+            checksum = sha256_if_small(dest, size=size) if size <= MOVE_HASH_MAX else ""
+        else:
+            # Hash while copying (preserves mtime like copy2); big raw data bypasses the page cache
+            checksum = copy_hashed(src, dest, direct=(category == "data"), size=size, chunk=io_chunk)
             if move:
-                shutil.move(str(src), str(dest))
-            else:
-                # copy2 preserves mtime
-                shutil.copy2(str(src), str(dest))
-
-            size = dest.stat().st_size if dest.exists() else 0
-            checksum = sha256_if_small(dest)
-            manifest_rows.append({
-                "original_path": str(src),
-                "new_path": str(dest),
-                "bytes": size,
-                "sha256_if_small": checksum,
-                "category": category,
-            })
-
-    # Write manifest CSV
+                os.unlink(src)
+        return {
+            "original_path": src,
+            "new_path": dest,
+            "bytes": size,
+            "sha256_if_small": checksum,
+            "category": category,
+        }
+
+    def try_place(job):
+        # A failing file is recorded, not raised: the rest still land and get their rows
+        try:
+            return place(job), None
+        except Exception as e:
+            return None, e
+
+    # Place files io_batch at a time, prefetching each batch's sources first.
+    # Manifest rows go straight to the CSV; only the log preview is kept in memory.
+    # With jobs > 1 a batch is placed by a thread pool; map() keeps manifest order.
+    # Small dumps (a few attachments) skip the prefetch and pool: plain sequential copies.
+    total_bytes = sum(job[3] for job in placements)
+    simple = len(placements) < SIMPLE_MAX_FILES and total_bytes < SIMPLE_MAX_BYTES
+    workers = 1 if simple else jobs if jobs > 0 else min(32, (os.cpu_count() or 1) * 4)
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    mode = "simple" if simple else f"batched ({io_batch} per batch, {workers} worker(s))"
+    print(f"Placing {len(placements)} files ({total_bytes / (1024*1024):.1f} MiB): {mode}")
     manifest_csv = project_dir / f"intake_manifest_{label}_{today}.csv"
-    with manifest_csv.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["original_path","new_path","bytes","sha256_if_small","category"])
-        writer.writeheader()
-        writer.writerows(manifest_rows)
+    preview_lines = []
+    placed = 0
+    failed = []
+    try:
+        with manifest_csv.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["original_path","new_path","bytes","sha256_if_small","category"])
+            writer.writeheader()
+            for i in range(0, len(placements), io_batch):
+                batch = placements[i:i+io_batch]
+                if not (rename or simple):
+                    prefetch([job[0] for job in batch], io_chunk)
+                results = pool.map(try_place, batch) if pool else map(try_place, batch)
+                for job, (row, err) in zip(batch, results):
+                    if err is not None:
+                        failed.append((job[0], err))
+                        continue
+                    writer.writerow(row)
+                    placed += 1
+                    if len(preview_lines) < 200:
+                        preview_lines.append(f"- {row['category']}: {row['original_path']}  →  {row['new_path']}")
+    finally:
+        if pool:
+            pool.shutdown()
+    if move and not rename and dump.is_dir():
+        # Only what we placed is gone; anything else (e.g. files that arrived after
+        # the scan) stays, and so does the dump root, which may be a mount point
+        prune_empty_children(dump)
 
     # Write human-readable summary
     log_md = project_dir / "INTAKE_LOG.md"
@@ -308,12 +611,18 @@ def intake_dump(base_dir: Path, project_name: str, dump_path: Path, source_label
     header += f"Mode: {'MOVE' if move else 'COPY'}\n\n"
     header += "Placed into:\n" + "\n".join([f"- `{k}` -> `{v}`" for k, v in dests.items()]) + "\n\n"
     header += f"Full manifest: `{manifest_csv.name}`\n\n"
-    # Preview first 200
-    preview = manifest_rows[:200]
-    rows = "\n".join([f"- {r['category']}: {r['original_path']}  →  {r['new_path']}" for r in preview])
-    more = "" if len(manifest_rows) <= 200 else f"\n… and {len(manifest_rows)-200} more (see CSV)."
+    # Preview first 200, written with the header in one call. Append mode is kept:
+    # INTAKE_LOG.md accumulates one section per intake.
+    more = "" if placed <= 200 else f"\n… and {placed-200} more (see CSV)."
+    if failed:
+        more += f"\n\nFailed to place {len(failed)} files:\n" + "\n".join([f"- {src}: {err}" for src, err in failed])
     with log_md.open("a", encoding="utf-8") as f:
-        f.write(header + rows + more + "\n\n")
+        f.write(header + "\n".join(preview_lines) + more + "\n\n")
+
+    if failed:
+        for src, err in failed:
+            print(f"[WARN] Could not place {src}: {err}")
+        raise SystemExit(f"{len(failed)} files could not be placed; the rest are in {manifest_csv}")
 
     print(f"Ingest complete. Summary: {log_md}")
     print(f"Manifest: {manifest_csv}")
@@ -332,16 +641,27 @@ def main(argv=None):
     parser.add_argument("--intake", help="Path to collaborator dump to ingest into a project")
     parser.add_argument("--project", help="Target project folder name, e.g., '2025-CRISPR-MutSim'")
     parser.add_argument("--source", help="Short label for the dump source (e.g., 'AliceLab')", default="")
-    parser.add_argument("--move", action="store_true", help="Move files instead of copying (faster, destructive)")
+    parser.add_argument("--move", action="store_true", help="Move files instead of copying (destructive; metadata-only on the same "
+                             "filesystem, otherwise each file is copied, then its source deleted)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker threads for placing files (default: 1; 0 = auto, min(32, 4 x CPUs))")
+    parser.add_argument("--io-chunk", type=int, default=HASH_CHUNK,
+                        help="Read/copy buffer and per-file readahead in bytes (default: 1 MiB)")
+    parser.add_argument("--io-batch", type=int, default=IO_BATCH,
+                        help="Files prefetched together before copying (default: 64; larger for "
+                             "NAS/HDD, smaller for lower per-file latency on NVMe)")
 
     args = parser.parse_args(argv)
+    if args.io_chunk <= 0 or args.io_batch <= 0:
+        parser.error("--io-chunk and --io-batch must be positive")
     base_dir = Path(os.path.expanduser(args.base))
 
     # Intake flow (has its own flags)
     if args.intake:
         if not args.project:
             raise SystemExit("Please supply --project 'YYYY-ProjectSlug' for intake.")
-        return intake_dump(base_dir, args.project, Path(args.intake), source_label=args.source, move=args.move)
+        return intake_dump(base_dir, args.project, Path(args.intake), source_label=args.source, move=args.move,
+                           jobs=args.jobs, io_chunk=args.io_chunk, io_batch=args.io_batch)
 
     # Setup / create flow
     if args.setup: